@@ -2738,12 +2738,15 @@ async def list_clients(
     skip: int = 0,
     limit: int = 100,
     search: Optional[str] = None,
+    status: Optional[str] = None,
     current_user: dict = Depends(require_admin_or_recruiter)
 ):
-    """List all clients with optional search and pagination"""
+    """List all clients with optional search, status filter and pagination"""
     query = {}
     if search:
         query["company_name"] = {"$regex": search, "$options": "i"}
+    if status:
+        query["status"] = status
     
     clients = await db.clients.find(query, {"_id": 0}).skip(skip).limit(limit).to_list(limit)
     
@@ -6017,6 +6020,8 @@ async def send_interview_invite(
     return {
         "message": "Interview invitation sent successfully",
         "interview_id": interview_id,
+        "invite_sent": True,
+        "interview_status": update_data["interview_status"],
         "email_sent": email_result.get("success", False),
         "candidate_email": candidate_email,
         "meeting_link": interview_data.get("meeting_link", ""),
@@ -6066,7 +6071,7 @@ async def mark_interview_completed(
         client_id=interview["client_id"]
     )
     
-    return {"message": "Interview marked as completed", "interview_id": interview_id}
+    return {"message": "Interview marked as completed", "interview_id": interview_id, "interview_status": "Completed"}
 
 
 @api_router.post("/interviews/{interview_id}/mark-no-show")
@@ -6123,7 +6128,13 @@ async def mark_interview_no_show(
         metadata={"no_show_count": current_no_show_count}
     )
     
-    return {"message": "Interview marked as no-show", "interview_id": interview_id, "no_show_count": current_no_show_count}
+    return {
+        "message": "Interview marked as no-show",
+        "interview_id": interview_id,
+        "interview_status": "No Show",
+        "no_show_flag": True,
+        "no_show_count": current_no_show_count
+    }
 
 
 @api_router.post("/interviews/{interview_id}/cancel")
@@ -6168,7 +6179,7 @@ async def cancel_interview(
         client_id=interview["client_id"]
     )
     
-    return {"message": "Interview cancelled", "interview_id": interview_id}
+    return {"message": "Interview cancelled", "interview_id": interview_id, "interview_status": "Cancelled"}
 
 
 # ============ MULTI-ROUND INTERVIEW FLOW ============
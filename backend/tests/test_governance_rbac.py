@@ -4,17 +4,133 @@ Comprehensive RBAC + Audit Foundation Testing
 Tests: Permission enforcement, audit logging, role management, tenant isolation, admin bypass
 """
 
-import requests
+import asyncio
+import base64
+import functools
+import httpx
+import orjson
 import json
+import os
+import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from types import MappingProxyType
 from typing import Dict, Optional
 
 API_URL = "https://hirematch-52.preview.emergentagent.com/api"
 
+PASS_MARK = "✅"
+FAIL_MARK = "❌"
+
+# Login tokens are reused across runs until they are within a minute of expiry.
+# Entries are keyed by API_URL and email; the file holds live JWTs, so it is owner-only.
+TOKEN_CACHE_PATH = Path.home() / ".cache" / "rbac_tokens.json"
+
+# Permissions for the custom role created in test_role_crud_operations
+CUSTOM_ROLE_PERMS = MappingProxyType({
+    "can_view_jobs": True,
+    "can_create_jobs": False,
+    "can_edit_jobs": False,
+    "can_delete_jobs": False,
+    "can_view_candidates": True,
+    "can_create_candidates": False,
+    "can_edit_candidates": False,
+    "can_delete_candidates": False,
+    "can_update_candidate_status": False,
+    "can_upload_cv": False,
+    "can_replace_cv": False,
+    "can_regenerate_story": False,
+    "can_view_full_cv": False,
+    "can_view_redacted_cv": True,
+    "can_view_audit_log": False,
+    "can_manage_roles": False,
+    "can_manage_users": False,
+    "can_export_reports": False
+})
+
+# Job the read-only Interviewer attempts (and must fail) to create
+JOB_PAYLOAD_MIN = MappingProxyType({
+    "title": "Test Job",
+    "location": "Remote",
+    "employment_type": "Full-time",
+    "experience_range": {"min_years": 0, "max_years": 2},
+    "work_model": "Remote",
+    "required_skills": ["Testing"],
+    "description": "Test job for permission check",
+    "status": "Active"
+})
+
+# Request bodies serialized once for reuse across calls
+JOB_PAYLOAD_MIN_BODY = orjson.dumps(dict(JOB_PAYLOAD_MIN))
+CUSTOM_ROLE_BODY = orjson.dumps({
+    "name": "Custom Test Role",
+    "description": "A test role for RBAC testing",
+    "permissions": dict(CUSTOM_ROLE_PERMS)
+})
+
+# Permission subsets each default role must grant (or deny)
+EXPECTED_CLIENT_OWNER_PERMS = MappingProxyType({
+    "can_create_jobs": True,
+    "can_edit_jobs": True,
+    "can_view_full_cv": True,
+    "can_manage_users": True,
+    "can_export_reports": True
+})
+
+EXPECTED_INTERVIEWER_PERMS = MappingProxyType({
+    "can_view_jobs": True,
+    "can_create_jobs": False,
+    "can_edit_jobs": False,
+    "can_upload_cv": False,
+    "can_view_full_cv": False,
+    "can_view_redacted_cv": True
+})
+
+
+def requires_role(role: str, name: str):
+    """Fail the decorated test without any request if `role` never logged in"""
+    def deco(fn):
+        @functools.wraps(fn)
+        def wrap(self, *args, **kwargs):
+            if role not in self.tokens:
+                return self.log_test(name, False, f"{role.capitalize()} not logged in")
+            return fn(self, *args, **kwargs)
+        return wrap
+    return deco
+
+
+def _json(resp):
+    """Decode a response body with orjson"""
+    return orjson.loads(resp.content)
+
+
+@dataclass
+class SuiteData:
+    """Setup results shared by the tests; built once setup has finished"""
+    client_a_id: str
+    client_b_id: str
+    # Client A's default roles by name; a missing role is reported by the tests that need it
+    roles_by_name: Dict[str, dict]
+
+
 class RBACTestSuite:
     def __init__(self):
         self.tokens = {}
         self.test_data = {}
+        self.client = httpx.Client(
+            base_url=API_URL,
+            http2=True,
+            limits=httpx.Limits(max_connections=4, max_keepalive_connections=4),
+            timeout=30.0
+        )
+        self.run_id = f"{int(time.time())}_{os.getpid()}"
+        self._token_cache = self._load_token_cache()
+        self._log_buf = []
+        self._log_lock = threading.Lock()
         self.results = {
             'total': 0,
             'passed': 0,
@@ -23,29 +139,87 @@ class RBACTestSuite:
         }
     
     def log_test(self, name: str, passed: bool, message: str = ""):
-        """Log test result"""
-        self.results['total'] += 1
-        if passed:
-            self.results['passed'] += 1
-            print(f"✅ {name}")
-        else:
-            self.results['failed'] += 1
-            error_msg = f"{name}: {message}"
-            self.results['errors'].append(error_msg)
-            print(f"❌ {name}")
-            if message:
-                print(f"   → {message}")
+        """Log test result (buffered until the summary)"""
+        with self._log_lock:
+            self.results['total'] += 1
+            if passed:
+                self.results['passed'] += 1
+                self._log_buf.append(f"{PASS_MARK} {name}")
+            else:
+                self.results['failed'] += 1
+                error_msg = f"{name}: {message}"
+                self.results['errors'].append(error_msg)
+                self._log_buf.append(f"{FAIL_MARK} {name}")
+                if message:
+                    self._log_buf.append(f"   → {message}")
+    
+    def log_section(self, title: str):
+        """Buffer a section heading alongside the test results"""
+        with self._log_lock:
+            self._log_buf.append(f"\n{title}")
+    
+    def _post_json(self, path: str, headers: Dict[str, str], payload_bytes: bytes):
+        """POST an already-serialized JSON body"""
+        h = {**headers, 'Content-Type': 'application/json'}
+        return self.client.post(path, headers=h, content=payload_bytes)
+    
+    def _status(self, method: str, path: str, headers: Dict[str, str], **kwargs) -> int:
+        """Send a request and return its status code without reading the body"""
+        with self.client.stream(method, path, headers=headers, **kwargs) as resp:
+            return resp.status_code
+    
+    def _read_head(self, resp, size: int = 4096) -> str:
+        """Read only the first chunk of a streamed response body"""
+        return next(resp.iter_bytes(size), b'').decode('utf-8', 'ignore')
+    
+    def _load_token_cache(self) -> Dict[str, dict]:
+        """Load cached login tokens from a previous run"""
+        try:
+            with open(TOKEN_CACHE_PATH) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+    
+    def _save_token_cache(self):
+        """Persist unexpired login tokens for the next run, readable by the owner only"""
+        now = time.time()
+        live = {key: entry for key, entry in self._token_cache.items() if entry['exp'] > now}
+        try:
+            TOKEN_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            fd = os.open(TOKEN_CACHE_PATH, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            # O_CREAT's mode only applies to new files; tighten one left by an older run
+            os.chmod(TOKEN_CACHE_PATH, 0o600)
+            with os.fdopen(fd, 'w') as f:
+                json.dump(live, f)
+        except OSError as e:
+            print(f"Could not write token cache: {str(e)}")
     
     def login(self, email: str, password: str, role_key: str) -> Optional[str]:
-        """Login and store token"""
+        """Login and store token, reusing a cached token that is still valid"""
+        cache_key = f"{API_URL} {email}"
+        cached = self._token_cache.get(cache_key)
         try:
-            resp = requests.post(f"{API_URL}/auth/login", json={
+            if cached and cached['exp'] - time.time() > 60:
+                # A revoked token (e.g. after a database reset) is dropped and replaced
+                if self.client.get("/auth/me", headers={"Authorization": f"Bearer {cached['token']}"}).status_code != 401:
+                    self.tokens[role_key] = cached['token']
+                    return self.tokens[role_key]
+                del self._token_cache[cache_key]
+            
+            resp = self.client.post("/auth/login", json={
                 "email": email,
                 "password": password
             })
             if resp.status_code == 200:
-                self.tokens[role_key] = resp.json()['access_token']
-                return self.tokens[role_key]
+                token = _json(resp)['access_token']
+                self.tokens[role_key] = token
+                
+                # Read exp from the JWT payload; no signature check is needed client-side
+                payload = json.loads(base64.urlsafe_b64decode(token.split('.')[1] + '=='))
+                if 'exp' in payload:
+                    self._token_cache[cache_key] = {'token': token, 'exp': payload['exp']}
+                    self._save_token_cache()
+                return token
             return None
         except Exception as e:
             print(f"Login error for {email}: {str(e)}")
@@ -72,6 +246,21 @@ class RBACTestSuite:
         
         return success
     
+    async def _setup_clients_async(self, headers: Dict[str, str]):
+        """Create Client A and Client B concurrently over one HTTP/2 connection"""
+        async with httpx.AsyncClient(base_url=API_URL, headers=headers, http2=True,
+                                     timeout=self.client.timeout) as c:
+            return await asyncio.gather(
+                c.post("/clients", json={
+                    "company_name": f"RBAC Test Corp A {self.run_id}",
+                    "status": "active"
+                }),
+                c.post("/clients", json={
+                    "company_name": f"RBAC Test Corp B {self.run_id}",
+                    "status": "active"
+                })
+            )
+    
     def setup_test_clients_and_roles(self):
         """Create test clients with default roles"""
         print("\n🔧 SETUP: Creating test clients and roles...")
@@ -79,56 +268,45 @@ class RBACTestSuite:
         # Create two test clients for tenant isolation testing
         headers = {"Authorization": f"Bearer {self.tokens['admin']}"}
         
-        # Client A
-        import time
-        timestamp = int(time.time())
-        resp_a = requests.post(f"{API_URL}/clients", headers=headers, json={
-            "company_name": f"RBAC Test Corp A {timestamp}",
-            "status": "active"
-        })
+        try:
+            resp_a, resp_b = asyncio.run(self._setup_clients_async(headers))
+        except httpx.HTTPError as e:
+            print(f"  ✗ Failed to create test clients: {str(e)}")
+            return False
         
+        # Client A
         if resp_a.status_code == 200:
-            self.test_data['client_a_id'] = resp_a.json()['client_id']
+            self.test_data['client_a_id'] = _json(resp_a)['client_id']
             print(f"  ✓ Client A: {self.test_data['client_a_id']}")
         else:
             print(f"  ✗ Failed to create Client A: {resp_a.status_code}")
             return False
         
         # Client B
-        resp_b = requests.post(f"{API_URL}/clients", headers=headers, json={
-            "company_name": f"RBAC Test Corp B {timestamp}",
-            "status": "active"
-        })
-        
         if resp_b.status_code == 200:
-            self.test_data['client_b_id'] = resp_b.json()['client_id']
+            self.test_data['client_b_id'] = _json(resp_b)['client_id']
             print(f"  ✓ Client B: {self.test_data['client_b_id']}")
         else:
             print(f"  ✗ Failed to create Client B: {resp_b.status_code}")
             return False
         
-        # Give system time to create default roles
-        time.sleep(1)
-        
-        # Verify default roles were created
-        roles_resp = requests.get(
-            f"{API_URL}/governance/roles?client_id={self.test_data['client_a_id']}",
-            headers=headers
-        )
+        # Poll until the default roles exist rather than sleeping a fixed second
+        roles_url = f"/governance/roles?client_id={self.test_data['client_a_id']}"
+        for delay in (0.01, 0.02, 0.05, 0.1, 0.2, 0.4):
+            roles_resp = self.client.get(roles_url, headers=headers)
+            if roles_resp.status_code == 200 and len(_json(roles_resp)) >= 3:
+                break
+            time.sleep(delay)
         
         if roles_resp.status_code == 200:
-            roles = roles_resp.json()
-            self.test_data['roles_client_a'] = roles
+            roles = _json(roles_resp)
             print(f"  ✓ Client A has {len(roles)} default roles")
             
-            # Store role IDs by name
-            for role in roles:
-                if role['name'] == 'Hiring Manager':
-                    self.test_data['hiring_manager_role_id'] = role['role_id']
-                elif role['name'] == 'Interviewer':
-                    self.test_data['interviewer_role_id'] = role['role_id']
-                elif role['name'] == 'Client Owner':
-                    self.test_data['client_owner_role_id'] = role['role_id']
+            # Index roles by name; setup only needs the Interviewer role's id
+            roles_by_name = {r['name']: r for r in roles}
+            self.test_data['roles_by_name'] = roles_by_name
+            if 'Interviewer' in roles_by_name:
+                self.test_data['interviewer_role_id'] = roles_by_name['Interviewer']['role_id']
         else:
             print(f"  ✗ Failed to get roles for Client A")
             return False
@@ -141,12 +319,15 @@ class RBACTestSuite:
         
         headers = {"Authorization": f"Bearer {self.tokens['admin']}"}
         
+        # Start the role CRUD test's create in the background; it only needs Client A
+        executor = ThreadPoolExecutor(max_workers=1)
+        self._crud_role_future = executor.submit(self._create_custom_role)
+        executor.shutdown(wait=False)
+        
         # Create test user for Client A with Interviewer role (read-only)
-        import time
-        timestamp = int(time.time())
-        test_email = f"interviewer{timestamp}@testcorpa.com"
+        test_email = f"interviewer{self.run_id}@testcorpa.com"
         
-        user_resp = requests.post(f"{API_URL}/clients/{self.test_data['client_a_id']}/users",
+        user_resp = self.client.post(f"/clients/{self.test_data['client_a_id']}/users",
             headers=headers,
             json={
                 "email": test_email,
@@ -159,7 +340,7 @@ class RBACTestSuite:
             print(f"  ✓ Created interviewer user")
             
             # Assign Interviewer role
-            assignment_resp = requests.post(f"{API_URL}/governance/user-roles",
+            assignment_resp = self.client.post("/governance/user-roles",
                 headers=headers,
                 json={
                     "user_id": test_email,
@@ -186,16 +367,26 @@ class RBACTestSuite:
         
         return True
     
+    def _create_custom_role(self):
+        """Create the custom role used by test_role_crud_operations"""
+        headers = {"Authorization": f"Bearer {self.tokens['admin']}"}
+        
+        return self._post_json(
+            f"/governance/roles?client_id={self.test_data['client_a_id']}",
+            headers,
+            CUSTOM_ROLE_BODY
+        )
+    
     # ========== TEST CASES ==========
     
     def test_default_roles_created(self):
         """Test that default roles are created for new clients"""
-        roles = self.test_data.get('roles_client_a', [])
+        roles_by_name = self.d.roles_by_name
         
         expected_roles = ['Client Owner', 'Hiring Manager', 'Interviewer']
-        found_roles = [r['name'] for r in roles]
+        found_roles = list(roles_by_name)
         
-        passed = all(role in found_roles for role in expected_roles)
+        passed = all(role in roles_by_name for role in expected_roles)
         self.log_test(
             "Default roles created for new client",
             passed,
@@ -204,23 +395,16 @@ class RBACTestSuite:
     
     def test_role_permissions_structure(self):
         """Test that roles have correct permission structure"""
-        roles = self.test_data.get('roles_client_a', [])
+        roles_by_name = self.d.roles_by_name
         
-        if not roles:
+        if not roles_by_name:
             self.log_test("Role permissions structure", False, "No roles found")
             return
         
         # Check that Client Owner has full permissions
-        client_owner = next((r for r in roles if r['name'] == 'Client Owner'), None)
+        client_owner = roles_by_name.get('Client Owner')
         if client_owner:
-            perms = client_owner['permissions']
-            passed = (
-                perms['can_create_jobs'] == True and
-                perms['can_edit_jobs'] == True and
-                perms['can_view_full_cv'] == True and
-                perms['can_manage_users'] == True and
-                perms['can_export_reports'] == True
-            )
+            passed = EXPECTED_CLIENT_OWNER_PERMS.items() <= client_owner['permissions'].items()
             self.log_test(
                 "Client Owner has full permissions",
                 passed,
@@ -230,17 +414,9 @@ class RBACTestSuite:
             self.log_test("Client Owner role exists", False, "Client Owner role not found")
         
         # Check that Interviewer has read-only permissions
-        interviewer = next((r for r in roles if r['name'] == 'Interviewer'), None)
+        interviewer = roles_by_name.get('Interviewer')
         if interviewer:
-            perms = interviewer['permissions']
-            passed = (
-                perms['can_view_jobs'] == True and
-                perms['can_create_jobs'] == False and
-                perms['can_edit_jobs'] == False and
-                perms['can_upload_cv'] == False and
-                perms['can_view_full_cv'] == False and
-                perms['can_view_redacted_cv'] == True
-            )
+            passed = EXPECTED_INTERVIEWER_PERMS.items() <= interviewer['permissions'].items()
             self.log_test(
                 "Interviewer has read-only permissions",
                 passed,
@@ -254,11 +430,11 @@ class RBACTestSuite:
         headers = {"Authorization": f"Bearer {self.tokens['admin']}"}
         
         # Admin should be able to list all roles across all clients
-        resp = requests.get(f"{API_URL}/governance/roles", headers=headers)
+        resp = self.client.get("/governance/roles", headers=headers)
         passed = resp.status_code == 200
         
         if passed:
-            roles = resp.json()
+            roles = _json(resp)
             # Should see roles from both Client A and Client B
             client_ids = set(r['client_id'] for r in roles)
             passed = len(client_ids) >= 2
@@ -279,61 +455,50 @@ class RBACTestSuite:
         headers = {"Authorization": f"Bearer {self.tokens['recruiter']}"}
         
         # Recruiter should be able to list all roles
-        resp = requests.get(f"{API_URL}/governance/roles", headers=headers)
-        passed = resp.status_code == 200
+        status = self._status("GET", "/governance/roles", headers)
+        passed = status == 200
         
         self.log_test(
             "Recruiter has admin-level access",
             passed,
-            f"Status {resp.status_code}" if not passed else ""
+            f"Status {status}" if not passed else ""
         )
     
+    @requires_role('interviewer', "Permission enforcement - create job")
     def test_permission_enforcement_create_job(self):
         """Test that Interviewer (read-only) cannot create jobs"""
-        if 'interviewer' not in self.tokens:
-            self.log_test("Permission enforcement - create job", False, "Interviewer not logged in")
-            return
-        
         headers = {"Authorization": f"Bearer {self.tokens['interviewer']}"}
         
         # Try to create a job (should fail)
-        resp = requests.post(f"{API_URL}/jobs", headers=headers, json={
-            "title": "Test Job",
-            "location": "Remote",
-            "employment_type": "Full-time",
-            "experience_range": {"min_years": 0, "max_years": 2},
-            "work_model": "Remote",
-            "required_skills": ["Testing"],
-            "description": "Test job for permission check",
-            "status": "Active"
-        })
+        status = self._status(
+            "POST", "/jobs",
+            {**headers, 'Content-Type': 'application/json'},
+            content=JOB_PAYLOAD_MIN_BODY
+        )
         
         # Should get 403 Forbidden
-        passed = resp.status_code == 403
+        passed = status == 403
         self.log_test(
             "Interviewer cannot create jobs (403)",
             passed,
-            f"Got status {resp.status_code}, expected 403"
+            f"Got status {status}, expected 403"
         )
     
+    @requires_role('interviewer', "Tenant isolation - roles")
     def test_tenant_isolation_roles(self):
         """Test that Client A user cannot see Client B roles"""
-        if 'interviewer' not in self.tokens:
-            self.log_test("Tenant isolation - roles", False, "Interviewer not logged in")
-            return
-        
         headers = {"Authorization": f"Bearer {self.tokens['interviewer']}"}
         
         # Try to get roles for Client B (should only see Client A)
-        resp = requests.get(
-            f"{API_URL}/governance/roles?client_id={self.test_data['client_b_id']}",
+        resp = self.client.get(
+            f"/governance/roles?client_id={self.d.client_b_id}",
             headers=headers
         )
         
         if resp.status_code == 200:
-            roles = resp.json()
+            roles = _json(resp)
             # Should get empty list or only Client A roles
-            passed = len(roles) == 0 or all(r['client_id'] == self.test_data['client_a_id'] for r in roles)
+            passed = len(roles) == 0 or all(r['client_id'] == self.d.client_a_id for r in roles)
             self.log_test(
                 "Client A user cannot see Client B roles",
                 passed,
@@ -353,10 +518,10 @@ class RBACTestSuite:
         headers = {"Authorization": f"Bearer {self.tokens['admin']}"}
         
         # Get audit logs
-        resp = requests.get(f"{API_URL}/governance/audit", headers=headers)
+        resp = self.client.get("/governance/audit", headers=headers)
         
         if resp.status_code == 200:
-            logs = resp.json()
+            logs = _json(resp)
             
             # Should have logs for CLIENT_CREATE, ROLE_CREATE, etc.
             action_types = [log['action_type'] for log in logs]
@@ -393,13 +558,13 @@ class RBACTestSuite:
         headers = {"Authorization": f"Bearer {self.tokens['admin']}"}
         
         # Filter by action type
-        resp = requests.get(
-            f"{API_URL}/governance/audit?action_type=CLIENT_CREATE",
+        resp = self.client.get(
+            "/governance/audit?action_type=CLIENT_CREATE",
             headers=headers
         )
         
         if resp.status_code == 200:
-            logs = resp.json()
+            logs = _json(resp)
             passed = all(log['action_type'] == 'CLIENT_CREATE' for log in logs)
             self.log_test(
                 "Audit logs can be filtered by action_type",
@@ -413,35 +578,32 @@ class RBACTestSuite:
                 f"Status {resp.status_code}"
             )
     
+    @requires_role('interviewer', "Client audit access restriction")
     def test_client_user_audit_access_restricted(self):
         """Test that client user can only see their own audit logs"""
-        if 'interviewer' not in self.tokens:
-            self.log_test("Client audit access restriction", False, "Interviewer not logged in")
-            return
-        
         headers = {"Authorization": f"Bearer {self.tokens['interviewer']}"}
         
         # Try to get audit logs (should fail - interviewer doesn't have can_view_audit_log)
-        resp = requests.get(f"{API_URL}/governance/audit", headers=headers)
+        status = self._status("GET", "/governance/audit", headers)
         
-        passed = resp.status_code == 403
+        passed = status == 403
         self.log_test(
             "Interviewer cannot view audit logs (403)",
             passed,
-            f"Got status {resp.status_code}, expected 403"
+            f"Got status {status}, expected 403"
         )
     
     def test_access_matrix_generation(self):
         """Test that access matrix can be generated"""
         headers = {"Authorization": f"Bearer {self.tokens['admin']}"}
         
-        resp = requests.get(
-            f"{API_URL}/governance/access-matrix?client_id={self.test_data['client_a_id']}",
+        resp = self.client.get(
+            f"/governance/access-matrix?client_id={self.d.client_a_id}",
             headers=headers
         )
         
         if resp.status_code == 200:
-            matrix = resp.json()
+            matrix = _json(resp)
             
             # Should have at least 1 user (the interviewer we created)
             passed = len(matrix) >= 1
@@ -465,49 +627,31 @@ class RBACTestSuite:
                 f"Status {resp.status_code}"
             )
     
+    def _discard_custom_role(self):
+        """Wait for the background custom role create and delete the role it made"""
+        create_resp = self._crud_role_future.result()
+        if create_resp.status_code == 200:
+            self.client.delete(
+                f"/governance/roles/{_json(create_resp)['role_id']}",
+                headers={"Authorization": f"Bearer {self.tokens['admin']}"}
+            )
+    
     def test_role_crud_operations(self):
         """Test creating, updating, and deleting custom roles"""
         headers = {"Authorization": f"Bearer {self.tokens['admin']}"}
         
-        # Create a custom role
-        create_resp = requests.post(
-            f"{API_URL}/governance/roles?client_id={self.test_data['client_a_id']}",
-            headers=headers,
-            json={
-                "name": "Custom Test Role",
-                "description": "A test role for RBAC testing",
-                "permissions": {
-                    "can_view_jobs": True,
-                    "can_create_jobs": False,
-                    "can_edit_jobs": False,
-                    "can_delete_jobs": False,
-                    "can_view_candidates": True,
-                    "can_create_candidates": False,
-                    "can_edit_candidates": False,
-                    "can_delete_candidates": False,
-                    "can_update_candidate_status": False,
-                    "can_upload_cv": False,
-                    "can_replace_cv": False,
-                    "can_regenerate_story": False,
-                    "can_view_full_cv": False,
-                    "can_view_redacted_cv": True,
-                    "can_view_audit_log": False,
-                    "can_manage_roles": False,
-                    "can_manage_users": False,
-                    "can_export_reports": False
-                }
-            }
-        )
+        # Custom role creation was started during setup
+        create_resp = self._crud_role_future.result()
         
         if create_resp.status_code == 200:
-            role = create_resp.json()
+            role = _json(create_resp)
             role_id = role['role_id']
             
             self.log_test("Custom role creation", True)
             
             # Update the role
-            update_resp = requests.put(
-                f"{API_URL}/governance/roles/{role_id}",
+            update_resp = self.client.put(
+                f"/governance/roles/{role_id}",
                 headers=headers,
                 json={
                     "name": "Updated Test Role"
@@ -516,14 +660,14 @@ class RBACTestSuite:
             
             passed = update_resp.status_code == 200
             if passed:
-                updated_role = update_resp.json()
+                updated_role = _json(update_resp)
                 passed = updated_role['name'] == "Updated Test Role"
             
             self.log_test("Custom role update", passed)
             
             # Delete the role
-            delete_resp = requests.delete(
-                f"{API_URL}/governance/roles/{role_id}",
+            delete_resp = self.client.delete(
+                f"/governance/roles/{role_id}",
                 headers=headers
             )
             
@@ -536,38 +680,40 @@ class RBACTestSuite:
                 f"Status {create_resp.status_code}: {create_resp.text}"
             )
     
+    @requires_role('interviewer', "Failed permission logging")
     def test_failed_permission_logged(self):
         """Test that failed permission checks are logged in audit"""
-        if 'interviewer' not in self.tokens:
-            self.log_test("Failed permission logging", False, "Interviewer not logged in")
-            return
-        
         headers_interviewer = {"Authorization": f"Bearer {self.tokens['interviewer']}"}
         headers_admin = {"Authorization": f"Bearer {self.tokens['admin']}"}
         
-        # Get current audit log count
-        before_resp = requests.get(f"{API_URL}/governance/audit", headers=headers_admin)
-        before_count = len(before_resp.json()) if before_resp.status_code == 200 else 0
+        # Only denials logged from here on count; test_permission_enforcement_create_job
+        # makes the same forbidden POST just before this test
+        since = datetime.now(timezone.utc).isoformat()
         
         # Attempt forbidden action
-        requests.post(f"{API_URL}/jobs", headers=headers_interviewer, json={
-            "title": "Should Fail",
-            "location": "Remote",
-            "employment_type": "Full-time",
-            "experience_range": {"min_years": 0, "max_years": 2},
-            "work_model": "Remote",
-            "required_skills": ["Test"],
-            "description": "Test",
-            "status": "Active"
-        })
-        
-        time.sleep(1)
-        
-        # Check if ACCESS_DENIED was logged
-        after_resp = requests.get(f"{API_URL}/governance/audit?action_type=ACCESS_DENIED", headers=headers_admin)
+        self._status(
+            "POST", "/jobs",
+            {**headers_interviewer, 'Content-Type': 'application/json'},
+            content=JOB_PAYLOAD_MIN_BODY
+        )
+        
+        # Poll until this POST's ACCESS_DENIED is logged under the caller's client
+        denied_params = {
+            "action_type": "ACCESS_DENIED",
+            "client_id": self.d.client_a_id,
+            "from_date": since,
+            "limit": 1
+        }
+        for delay in (0.01, 0.02, 0.05, 0.1, 0.2, 0.4):
+            after_resp = self.client.get("/governance/audit", params=denied_params, headers=headers_admin)
+            if after_resp.status_code != 200:
+                break
+            denied_logs = _json(after_resp)
+            if denied_logs:
+                break
+            time.sleep(delay)
         
         if after_resp.status_code == 200:
-            denied_logs = after_resp.json()
             passed = len(denied_logs) > 0
             self.log_test(
                 "Failed permission attempts are logged",
@@ -581,13 +727,13 @@ class RBACTestSuite:
         """Test that audit logs can be exported as CSV"""
         headers = {"Authorization": f"Bearer {self.tokens['admin']}"}
         
-        resp = requests.get(f"{API_URL}/governance/audit/export", headers=headers)
-        
-        passed = resp.status_code == 200 and 'text/csv' in resp.headers.get('content-type', '')
-        
-        if passed:
-            content = resp.text
-            passed = 'log_id' in content and 'timestamp' in content
+        with self.client.stream("GET", "/governance/audit/export", headers=headers) as resp:
+            passed = resp.status_code == 200 and 'text/csv' in resp.headers.get('content-type', '')
+            
+            if passed:
+                # Column names are on the first line, so only read the first chunk
+                head = self._read_head(resp)
+                passed = 'log_id' in head and 'timestamp' in head
         
         self.log_test(
             "Audit log CSV export",
@@ -599,16 +745,16 @@ class RBACTestSuite:
         """Test that access matrix can be exported as CSV"""
         headers = {"Authorization": f"Bearer {self.tokens['admin']}"}
         
-        resp = requests.get(
-            f"{API_URL}/governance/access-matrix/export?client_id={self.test_data['client_a_id']}",
+        with self.client.stream(
+            "GET",
+            f"/governance/access-matrix/export?client_id={self.d.client_a_id}",
             headers=headers
-        )
-        
-        passed = resp.status_code == 200 and 'text/csv' in resp.headers.get('content-type', '')
-        
-        if passed:
-            content = resp.text
-            passed = 'user_email' in content and 'can_view_jobs' in content
+        ) as resp:
+            passed = resp.status_code == 200 and 'text/csv' in resp.headers.get('content-type', '')
+            
+            if passed:
+                head = self._read_head(resp)
+                passed = 'user_email' in head and 'can_view_jobs' in head
         
         self.log_test(
             "Access matrix CSV export",
@@ -626,58 +772,69 @@ class RBACTestSuite:
         
         # Setup
         if not self.setup_test_users():
-            print("\n❌ CRITICAL: Failed to authenticate test users")
+            print(f"\n{FAIL_MARK} CRITICAL: Failed to authenticate test users")
             return
         
         if not self.setup_test_clients_and_roles():
-            print("\n❌ CRITICAL: Failed to setup test clients and roles")
+            print(f"\n{FAIL_MARK} CRITICAL: Failed to setup test clients and roles")
             return
         
         if not self.setup_test_users_with_roles():
-            print("\n❌ CRITICAL: Failed to setup users with specific roles")
+            print(f"\n{FAIL_MARK} CRITICAL: Failed to setup users with specific roles")
+            # The role CRUD test never runs, so its pre-created role is cleaned up here
+            self._discard_custom_role()
             return
         
+        self.d = SuiteData(
+            client_a_id=self.test_data['client_a_id'],
+            client_b_id=self.test_data['client_b_id'],
+            roles_by_name=self.test_data['roles_by_name']
+        )
+        
         print("\n" + "="*60)
         print("📋 RUNNING TESTS")
         print("="*60)
         
-        # Run all test cases
-        print("\n🔐 RBAC Tests:")
-        self.test_default_roles_created()
-        self.test_role_permissions_structure()
-        self.test_admin_bypass_permissions()
-        self.test_recruiter_bypass_permissions()
-        
-        print("\n🚫 Permission Enforcement Tests:")
-        self.test_permission_enforcement_create_job()
-        self.test_failed_permission_logged()
-        
-        print("\n🏢 Tenant Isolation Tests:")
-        self.test_tenant_isolation_roles()
-        
-        print("\n📊 Audit Logging Tests:")
-        self.test_audit_log_creation()
-        self.test_audit_log_filtering()
-        self.test_client_user_audit_access_restricted()
-        
-        print("\n🗂️ Governance Features Tests:")
-        self.test_access_matrix_generation()
-        self.test_role_crud_operations()
-        self.test_export_audit_csv()
-        self.test_export_access_matrix_csv()
+        # Run all test cases; results are buffered, so flush them even if a test raises
+        try:
+            self.log_section("🔐 RBAC Tests:")
+            self.test_default_roles_created()
+            self.test_role_permissions_structure()
+            self.test_admin_bypass_permissions()
+            self.test_recruiter_bypass_permissions()
+            
+            self.log_section("🚫 Permission Enforcement Tests:")
+            self.test_permission_enforcement_create_job()
+            self.test_failed_permission_logged()
+            
+            self.log_section("🏢 Tenant Isolation Tests:")
+            self.test_tenant_isolation_roles()
+            
+            self.log_section("📊 Audit Logging Tests:")
+            self.test_audit_log_creation()
+            self.test_audit_log_filtering()
+            self.test_client_user_audit_access_restricted()
+            
+            self.log_section("🗂️ Governance Features Tests:")
+            self.test_access_matrix_generation()
+            self.test_role_crud_operations()
+            self.test_export_audit_csv()
+            self.test_export_access_matrix_csv()
+        finally:
+            sys.stdout.write("\n".join(self._log_buf) + "\n")
         
         # Summary
         print("\n" + "="*60)
         print("📊 TEST SUMMARY")
         print("="*60)
         print(f"Total Tests:  {self.results['total']}")
-        print(f"✅ Passed:    {self.results['passed']}")
-        print(f"❌ Failed:    {self.results['failed']}")
+        print(f"{PASS_MARK} Passed:    {self.results['passed']}")
+        print(f"{FAIL_MARK} Failed:    {self.results['failed']}")
         print(f"Success Rate: {(self.results['passed']/self.results['total']*100):.1f}%")
         
         if self.results['errors']:
             print("\n" + "="*60)
-            print("❌ FAILED TESTS DETAILS")
+            print(f"{FAIL_MARK} FAILED TESTS DETAILS")
             print("="*60)
             for error in self.results['errors']:
                 print(f"  • {error}")
@@ -689,6 +846,9 @@ class RBACTestSuite:
 
 if __name__ == "__main__":
     suite = RBACTestSuite()
-    success = suite.run_all_tests()
+    try:
+        success = suite.run_all_tests()
+    finally:
+        suite.client.close()
     
     exit(0 if success else 1)
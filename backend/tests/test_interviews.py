@@ -2,13 +2,24 @@
 Interview Orchestration API Tests
 Tests for interview creation, slot booking, invite sending, and status management
 """
+import asyncio
+import base64
+import functools
+import httpx
+import json
+import orjson
 import pytest
 import requests
 import os
-from datetime import datetime, timedelta
+import time
+from datetime import datetime, timedelta, timezone
+from urllib3.util.request import ACCEPT_ENCODING
 
 BASE_URL = os.environ.get('REACT_APP_BACKEND_URL', '').rstrip('/')
 
+# (connect, read) timeout applied to every session request so a hung backend fails fast
+REQUEST_TIMEOUT = (3, 10)
+
 # Test credentials
 ADMIN_EMAIL = "admin@arbeit.com"
 ADMIN_PASSWORD = "admin123"
@@ -20,16 +31,45 @@ EXISTING_JOB_ID = "job_4a1de442"
 EXISTING_CANDIDATE_ID = "cand_ffec2ded"
 EXISTING_INTERVIEW_ID = "int_2027ba976be2"
 
+PIPELINE_STATS_FIELDS = frozenset({
+    "total_interviews", "awaiting_confirmation", "confirmed", "scheduled",
+    "completed", "no_shows", "cancelled"
+})
+
+# Future slot datetimes keyed by days ahead, computed once at import
+BASE = datetime.now(timezone.utc)
+SLOTS = {
+    i: {
+        "start": BASE + timedelta(days=i, hours=10),
+        "end": BASE + timedelta(days=i, hours=11)
+    }
+    for i in range(1, 10)
+}
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def _body(payload):
+    """Serialize a request payload with orjson; aware datetimes become RFC 3339 with a Z suffix"""
+    return orjson.dumps(payload, option=orjson.OPT_UTC_Z)
+
+# Interviews created up front: (interview_mode, duration, days ahead), keyed by
+# the fixture that hands them out
+FLOW_INTERVIEWS = {
+    "invalid_slot": ("Phone", 30, 4),
+    "booked": ("Video", 60, 5),
+}
+
 
 class TestAuthSetup:
     """Authentication setup tests"""
     
     def test_admin_login(self, api_client):
         """Test admin login and get token"""
-        response = api_client.post(f"{BASE_URL}/api/auth/login", json={
+        response = api_client.post(f"{BASE_URL}/api/auth/login", headers=JSON_HEADERS, data=_body({
             "email": ADMIN_EMAIL,
             "password": ADMIN_PASSWORD
-        })
+        }))
         assert response.status_code == 200, f"Admin login failed: {response.text}"
         data = response.json()
         assert "access_token" in data
@@ -38,10 +78,10 @@ class TestAuthSetup:
     
     def test_client_login(self, api_client):
         """Test client user login"""
-        response = api_client.post(f"{BASE_URL}/api/auth/login", json={
+        response = api_client.post(f"{BASE_URL}/api/auth/login", headers=JSON_HEADERS, data=_body({
             "email": CLIENT_EMAIL,
             "password": CLIENT_PASSWORD
-        })
+        }))
         assert response.status_code == 200, f"Client login failed: {response.text}"
         data = response.json()
         assert "access_token" in data
@@ -53,13 +93,6 @@ class TestInterviewCreate:
     
     def test_create_interview_success(self, authenticated_admin_client):
         """Test creating a new interview with proposed slots"""
-        # Generate future time slots
-        now = datetime.utcnow()
-        slot1_start = (now + timedelta(days=1, hours=10)).isoformat() + "Z"
-        slot1_end = (now + timedelta(days=1, hours=11)).isoformat() + "Z"
-        slot2_start = (now + timedelta(days=2, hours=14)).isoformat() + "Z"
-        slot2_end = (now + timedelta(days=2, hours=15)).isoformat() + "Z"
-        
         payload = {
             "job_id": EXISTING_JOB_ID,
             "candidate_id": EXISTING_CANDIDATE_ID,
@@ -67,14 +100,14 @@ class TestInterviewCreate:
             "interview_duration": 60,
             "time_zone": "Asia/Kolkata",
             "proposed_slots": [
-                {"start_time": slot1_start, "end_time": slot1_end},
-                {"start_time": slot2_start, "end_time": slot2_end}
+                {"start_time": SLOTS[1]["start"], "end_time": SLOTS[1]["end"]},
+                {"start_time": SLOTS[2]["start"], "end_time": SLOTS[2]["end"]}
             ],
             "meeting_link": "https://meet.google.com/test-meeting",
             "additional_instructions": "Please join 5 minutes early"
         }
         
-        response = authenticated_admin_client.post(f"{BASE_URL}/api/interviews", json=payload)
+        response = authenticated_admin_client.post(f"{BASE_URL}/api/interviews", data=_body(payload), headers=JSON_HEADERS)
         assert response.status_code == 200, f"Create interview failed: {response.text}"
         
         data = response.json()
@@ -91,38 +124,7 @@ class TestInterviewCreate:
         # Store for later tests
         return data["interview_id"]
     
-    def test_create_interview_invalid_job(self, authenticated_admin_client):
-        """Test creating interview with non-existent job"""
-        payload = {
-            "job_id": "job_nonexistent",
-            "candidate_id": EXISTING_CANDIDATE_ID,
-            "interview_mode": "Phone",
-            "interview_duration": 30,
-            "proposed_slots": [
-                {"start_time": "2025-01-20T10:00:00Z", "end_time": "2025-01-20T10:30:00Z"}
-            ]
-        }
-        
-        response = authenticated_admin_client.post(f"{BASE_URL}/api/interviews", json=payload)
-        assert response.status_code == 404
-        assert "Job not found" in response.json()["detail"]
-    
-    def test_create_interview_invalid_candidate(self, authenticated_admin_client):
-        """Test creating interview with non-existent candidate"""
-        payload = {
-            "job_id": EXISTING_JOB_ID,
-            "candidate_id": "cand_nonexistent",
-            "interview_mode": "Onsite",
-            "interview_duration": 45,
-            "proposed_slots": [
-                {"start_time": "2025-01-20T10:00:00Z", "end_time": "2025-01-20T10:45:00Z"}
-            ]
-        }
-        
-        response = authenticated_admin_client.post(f"{BASE_URL}/api/interviews", json=payload)
-        assert response.status_code == 404
-        assert "Candidate not found" in response.json()["detail"]
-    
+    @pytest.mark.error_path
     def test_create_interview_without_auth(self, api_client):
         """Test creating interview without authentication"""
         payload = {
@@ -133,7 +135,7 @@ class TestInterviewCreate:
             "proposed_slots": []
         }
         
-        response = api_client.post(f"{BASE_URL}/api/interviews", json=payload)
+        response = api_client.post(f"{BASE_URL}/api/interviews", data=_body(payload), headers=JSON_HEADERS)
         assert response.status_code in [401, 403]
 
 
@@ -142,11 +144,13 @@ class TestInterviewList:
     
     def test_list_interviews(self, authenticated_admin_client):
         """Test listing all interviews"""
-        response = authenticated_admin_client.get(f"{BASE_URL}/api/interviews")
+        # Only the first item's shape is checked, so fetch a single row
+        response = authenticated_admin_client.get(f"{BASE_URL}/api/interviews", params={"limit": 1})
         assert response.status_code == 200
         
         data = response.json()
         assert isinstance(data, list)
+        assert len(data) <= 1
         
         if len(data) > 0:
             interview = data[0]
@@ -197,76 +201,16 @@ class TestInterviewDetails:
         assert "interview_status" in data
         assert "proposed_slots" in data
         assert "created_at" in data
-    
-    def test_get_interview_not_found(self, authenticated_admin_client):
-        """Test getting non-existent interview"""
-        response = authenticated_admin_client.get(f"{BASE_URL}/api/interviews/int_nonexistent")
-        assert response.status_code == 404
-        assert "Interview not found" in response.json()["detail"]
+
 
 
 class TestInterviewSlotBooking:
     """POST /api/interviews/{interview_id}/book-slot - Book slot tests"""
     
-    def test_book_slot_success(self, authenticated_admin_client):
-        """Test booking an interview slot"""
-        # First create a new interview to book
-        now = datetime.utcnow()
-        slot1_start = (now + timedelta(days=3, hours=10)).isoformat() + "Z"
-        slot1_end = (now + timedelta(days=3, hours=11)).isoformat() + "Z"
-        
-        create_payload = {
-            "job_id": EXISTING_JOB_ID,
-            "candidate_id": EXISTING_CANDIDATE_ID,
-            "interview_mode": "Video",
-            "interview_duration": 60,
-            "proposed_slots": [
-                {"start_time": slot1_start, "end_time": slot1_end}
-            ]
-        }
-        
-        create_response = authenticated_admin_client.post(f"{BASE_URL}/api/interviews", json=create_payload)
-        assert create_response.status_code == 200
-        interview_data = create_response.json()
-        interview_id = interview_data["interview_id"]
-        slot_id = interview_data["proposed_slots"][0]["slot_id"]
-        
-        # Now book the slot
-        book_payload = {
-            "slot_id": slot_id,
-            "confirmed": True
-        }
-        
-        book_response = authenticated_admin_client.post(
-            f"{BASE_URL}/api/interviews/{interview_id}/book-slot",
-            json=book_payload
-        )
-        assert book_response.status_code == 200
-        
-        booked_data = book_response.json()
-        assert booked_data["interview_status"] == "Confirmed"
-        assert booked_data["selected_slot_id"] == slot_id
-        assert booked_data["scheduled_start_time"] is not None
-    
-    def test_book_slot_invalid_slot(self, authenticated_admin_client):
+    @pytest.mark.error_path
+    def test_book_slot_invalid_slot(self, authenticated_admin_client, invalid_slot_interview):
         """Test booking with invalid slot_id"""
-        # First create a new interview
-        now = datetime.utcnow()
-        slot1_start = (now + timedelta(days=4, hours=10)).isoformat() + "Z"
-        slot1_end = (now + timedelta(days=4, hours=11)).isoformat() + "Z"
-        
-        create_payload = {
-            "job_id": EXISTING_JOB_ID,
-            "candidate_id": EXISTING_CANDIDATE_ID,
-            "interview_mode": "Phone",
-            "interview_duration": 30,
-            "proposed_slots": [
-                {"start_time": slot1_start, "end_time": slot1_end}
-            ]
-        }
-        
-        create_response = authenticated_admin_client.post(f"{BASE_URL}/api/interviews", json=create_payload)
-        interview_id = create_response.json()["interview_id"]
+        interview_id, _ = invalid_slot_interview
         
         # Try to book with invalid slot
         book_payload = {
@@ -276,7 +220,8 @@ class TestInterviewSlotBooking:
         
         book_response = authenticated_admin_client.post(
             f"{BASE_URL}/api/interviews/{interview_id}/book-slot",
-            json=book_payload
+            data=_body(book_payload),
+            headers=JSON_HEADERS
         )
         assert book_response.status_code == 404
         assert "Slot not found" in book_response.json()["detail"]
@@ -285,131 +230,48 @@ class TestInterviewSlotBooking:
 class TestInterviewInvite:
     """POST /api/interviews/{interview_id}/send-invite - Send invite tests"""
     
-    def test_send_invite_success(self, authenticated_admin_client):
+    def test_send_invite_success(self, authenticated_admin_client, booked_interview):
         """Test sending interview invite"""
-        # Create and book an interview first
-        now = datetime.utcnow()
-        slot1_start = (now + timedelta(days=5, hours=10)).isoformat() + "Z"
-        slot1_end = (now + timedelta(days=5, hours=11)).isoformat() + "Z"
-        
-        create_payload = {
-            "job_id": EXISTING_JOB_ID,
-            "candidate_id": EXISTING_CANDIDATE_ID,
-            "interview_mode": "Video",
-            "interview_duration": 60,
-            "proposed_slots": [
-                {"start_time": slot1_start, "end_time": slot1_end}
-            ]
-        }
-        
-        create_response = authenticated_admin_client.post(f"{BASE_URL}/api/interviews", json=create_payload)
-        interview_data = create_response.json()
-        interview_id = interview_data["interview_id"]
-        slot_id = interview_data["proposed_slots"][0]["slot_id"]
-        
-        # Book the slot
-        book_payload = {"slot_id": slot_id, "confirmed": True}
-        authenticated_admin_client.post(f"{BASE_URL}/api/interviews/{interview_id}/book-slot", json=book_payload)
+        interview_id, _, _ = booked_interview
         
         # Send invite
         invite_response = authenticated_admin_client.post(f"{BASE_URL}/api/interviews/{interview_id}/send-invite")
         assert invite_response.status_code == 200
         
         invite_data = invite_response.json()
-        assert invite_data["message"] == "Invite marked as sent"
+        assert invite_data["message"] == "Interview invitation sent successfully"
         assert invite_data["interview_id"] == interview_id
-        
-        # Verify interview status updated
-        get_response = authenticated_admin_client.get(f"{BASE_URL}/api/interviews/{interview_id}")
-        assert get_response.json()["invite_sent"] == True
-        assert get_response.json()["interview_status"] == "Scheduled"
+        assert invite_data["invite_sent"] == True
+        assert invite_data["interview_status"] == "Scheduled"
 
 
 class TestInterviewStatusActions:
-    """Tests for mark-completed, mark-no-show, cancel endpoints"""
+    """Book, mark-completed, mark-no-show and cancel, applied in order to the shared booked interview"""
     
-    def test_mark_completed(self, authenticated_admin_client):
-        """Test marking interview as completed"""
-        # Create a scheduled interview
-        now = datetime.utcnow()
-        slot1_start = (now + timedelta(days=6, hours=10)).isoformat() + "Z"
-        slot1_end = (now + timedelta(days=6, hours=11)).isoformat() + "Z"
-        
-        create_payload = {
-            "job_id": EXISTING_JOB_ID,
-            "candidate_id": EXISTING_CANDIDATE_ID,
-            "interview_mode": "Video",
-            "interview_duration": 60,
-            "proposed_slots": [{"start_time": slot1_start, "end_time": slot1_end}]
-        }
-        
-        create_response = authenticated_admin_client.post(f"{BASE_URL}/api/interviews", json=create_payload)
-        interview_id = create_response.json()["interview_id"]
+    def test_book_slot_confirms(self, booked_interview):
+        """Test that booking a slot confirms the interview"""
+        _, slot_id, booking = booked_interview
         
-        # Mark as completed
-        complete_response = authenticated_admin_client.post(f"{BASE_URL}/api/interviews/{interview_id}/mark-completed")
-        assert complete_response.status_code == 200
-        assert complete_response.json()["message"] == "Interview marked as completed"
-        
-        # Verify status
-        get_response = authenticated_admin_client.get(f"{BASE_URL}/api/interviews/{interview_id}")
-        assert get_response.json()["interview_status"] == "Completed"
+        assert booking["interview_status"] == "Confirmed"
+        assert booking["selected_slot_id"] == slot_id
+        assert booking["scheduled_start_time"] is not None
     
-    def test_mark_no_show(self, authenticated_admin_client):
-        """Test marking interview as no-show"""
-        # Create interview
-        now = datetime.utcnow()
-        slot1_start = (now + timedelta(days=7, hours=10)).isoformat() + "Z"
-        slot1_end = (now + timedelta(days=7, hours=11)).isoformat() + "Z"
-        
-        create_payload = {
-            "job_id": EXISTING_JOB_ID,
-            "candidate_id": EXISTING_CANDIDATE_ID,
-            "interview_mode": "Phone",
-            "interview_duration": 30,
-            "proposed_slots": [{"start_time": slot1_start, "end_time": slot1_end}]
-        }
-        
-        create_response = authenticated_admin_client.post(f"{BASE_URL}/api/interviews", json=create_payload)
-        interview_id = create_response.json()["interview_id"]
+    @pytest.mark.parametrize("action,expected_status,expected_fields", [
+        ("mark-completed", "Completed", {"message": "Interview marked as completed"}),
+        ("mark-no-show", "No Show", {"message": "Interview marked as no-show", "no_show_count": 1, "no_show_flag": True}),
+        ("cancel", "Cancelled", {"message": "Interview cancelled"}),
+    ], ids=["mark-completed", "mark-no-show", "cancel"])
+    def test_action_sets_status(self, authenticated_admin_client, booked_interview, action, expected_status, expected_fields):
+        """Test that each action moves the interview to its expected status"""
+        interview_id, _, _ = booked_interview
+        
+        response = authenticated_admin_client.post(f"{BASE_URL}/api/interviews/{interview_id}/{action}")
+        assert response.status_code == 200, f"{action} failed: {response.text}"
         
-        # Mark as no-show
-        no_show_response = authenticated_admin_client.post(f"{BASE_URL}/api/interviews/{interview_id}/mark-no-show")
-        assert no_show_response.status_code == 200
-        assert no_show_response.json()["message"] == "Interview marked as no-show"
-        assert no_show_response.json()["no_show_count"] == 1
-        
-        # Verify status
-        get_response = authenticated_admin_client.get(f"{BASE_URL}/api/interviews/{interview_id}")
-        assert get_response.json()["interview_status"] == "No Show"
-        assert get_response.json()["no_show_flag"] == True
-    
-    def test_cancel_interview(self, authenticated_admin_client):
-        """Test cancelling an interview"""
-        # Create interview
-        now = datetime.utcnow()
-        slot1_start = (now + timedelta(days=8, hours=10)).isoformat() + "Z"
-        slot1_end = (now + timedelta(days=8, hours=11)).isoformat() + "Z"
-        
-        create_payload = {
-            "job_id": EXISTING_JOB_ID,
-            "candidate_id": EXISTING_CANDIDATE_ID,
-            "interview_mode": "Onsite",
-            "interview_duration": 90,
-            "proposed_slots": [{"start_time": slot1_start, "end_time": slot1_end}]
-        }
-        
-        create_response = authenticated_admin_client.post(f"{BASE_URL}/api/interviews", json=create_payload)
-        interview_id = create_response.json()["interview_id"]
-        
-        # Cancel interview
-        cancel_response = authenticated_admin_client.post(f"{BASE_URL}/api/interviews/{interview_id}/cancel")
-        assert cancel_response.status_code == 200
-        assert cancel_response.json()["message"] == "Interview cancelled"
-        
-        # Verify status
-        get_response = authenticated_admin_client.get(f"{BASE_URL}/api/interviews/{interview_id}")
-        assert get_response.json()["interview_status"] == "Cancelled"
+        data = response.json()
+        assert data["interview_status"] == expected_status
+        for field, value in expected_fields.items():
+            assert data[field] == value, f"{field}: expected {value!r}, got {data[field]!r}"
 
 
 class TestInterviewPipelineStats:
@@ -421,18 +283,11 @@ class TestInterviewPipelineStats:
         assert response.status_code == 200
         
         data = response.json()
-        assert "total_interviews" in data
-        assert "awaiting_confirmation" in data
-        assert "confirmed" in data
-        assert "scheduled" in data
-        assert "completed" in data
-        assert "no_shows" in data
-        assert "cancelled" in data
+        missing = PIPELINE_STATS_FIELDS - data.keys()
+        assert not missing, f"Missing: {missing}"
         
         # All values should be non-negative integers
-        for key, value in data.items():
-            assert isinstance(value, int)
-            assert value >= 0
+        assert all(isinstance(v, int) and v >= 0 for v in data.values()), f"Non-integer or negative stats: {data}"
 
 
 class TestCandidateInterviews:
@@ -450,56 +305,197 @@ class TestCandidateInterviews:
             assert interview["candidate_id"] == EXISTING_CANDIDATE_ID
             assert "interview_id" in interview
             assert "interview_status" in interview
+
+
+
+@pytest.mark.error_path
+class TestNotFoundPaths:
+    """Requests referencing a non-existent job, candidate or interview return 404"""
     
-    def test_get_candidate_interviews_not_found(self, authenticated_admin_client):
-        """Test getting interviews for non-existent candidate"""
-        response = authenticated_admin_client.get(f"{BASE_URL}/api/candidates/cand_nonexistent/interviews")
-        assert response.status_code == 404
+    @pytest.mark.parametrize("method,path,payload,expected_detail", [
+        ("POST", "/api/interviews", {
+            "job_id": "job_nonexistent",
+            "candidate_id": EXISTING_CANDIDATE_ID,
+            "interview_mode": "Phone",
+            "interview_duration": 30,
+            "proposed_slots": [
+                {"start_time": "2025-01-20T10:00:00Z", "end_time": "2025-01-20T10:30:00Z"}
+            ]
+        }, "Job not found"),
+        ("POST", "/api/interviews", {
+            "job_id": EXISTING_JOB_ID,
+            "candidate_id": "cand_nonexistent",
+            "interview_mode": "Onsite",
+            "interview_duration": 45,
+            "proposed_slots": [
+                {"start_time": "2025-01-20T10:00:00Z", "end_time": "2025-01-20T10:45:00Z"}
+            ]
+        }, "Candidate not found"),
+        ("GET", "/api/interviews/int_nonexistent", None, "Interview not found"),
+        ("GET", "/api/candidates/cand_nonexistent/interviews", None, None),
+    ], ids=["create-invalid-job", "create-invalid-candidate", "get-interview", "candidate-interviews"])
+    def test_not_found(self, authenticated_admin_client, method, path, payload, expected_detail):
+        """Test that the request is rejected with 404 and the expected detail"""
+        kwargs = {"data": _body(payload), "headers": JSON_HEADERS} if payload is not None else {}
+        response = authenticated_admin_client.request(method, f"{BASE_URL}{path}", **kwargs)
+        assert response.status_code == 404, f"Expected 404, got {response.status_code}: {response.text}"
+        if expected_detail:
+            assert expected_detail in response.json()["detail"]
 
 
 # ============ FIXTURES ============
+# Session-scoped so each (xdist) worker logs in once per role. Each role gets
+# its own requests.Session so auth headers never leak between fixtures.
 
-@pytest.fixture
-def api_client():
-    """Shared requests session"""
+def _session(**headers):
+    """Build a requests session with its default headers set once.
+
+    Content-Type is not a session default: bodies are pre-serialized with _body()
+    and sent with JSON_HEADERS. Accept-Encoding only advertises codecs urllib3
+    can decode here (br needs brotli installed).
+    """
     session = requests.Session()
-    session.headers.update({"Content-Type": "application/json"})
+    session.headers.update({
+        "Accept-Encoding": ACCEPT_ENCODING,
+        "Connection": "keep-alive",
+        **headers
+    })
+    session.request = functools.partial(session.request, timeout=REQUEST_TIMEOUT)
     return session
 
 
-@pytest.fixture
-def admin_token(api_client):
+@pytest.fixture(scope="session")
+def api_client():
+    """Shared unauthenticated requests session"""
+    session = _session()
+    yield session
+    session.close()
+
+
+def _token_exp(token):
+    """Read the exp claim from a JWT payload (no signature check), or 0 if unreadable"""
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(token.split(".")[1] + "=="))
+        return payload.get("exp", 0)
+    except (IndexError, ValueError):
+        return 0
+
+
+def _login_cached(request, api_client, cache_key, email, password):
+    """Log in, reusing a token from pytest's cache while it has >30s left"""
+    cache = getattr(request.config, "cache", None)
+    cached = cache.get(cache_key, None) if cache else None
+    if cached and cached.get("base_url") == BASE_URL and _token_exp(cached["token"]) > time.time() + 30:
+        # exp is read unverified; a token the server rejects (secret rotated, DB reset)
+        # is dropped and replaced by a fresh login
+        me = api_client.get(f"{BASE_URL}/api/auth/me", headers={"Authorization": f"Bearer {cached['token']}"})
+        if me.status_code != 401:
+            return cached["token"]
+        cache.set(cache_key, None)
+    
+    response = api_client.post(f"{BASE_URL}/api/auth/login", headers=JSON_HEADERS, data=_body({
+        "email": email,
+        "password": password
+    }))
+    if response.status_code != 200:
+        return None
+    token = response.json().get("access_token")
+    if cache and token:
+        cache.set(cache_key, {"base_url": BASE_URL, "token": token})
+    return token
+
+
+@pytest.fixture(scope="session")
+def admin_token(request, api_client):
     """Get admin authentication token"""
-    response = api_client.post(f"{BASE_URL}/api/auth/login", json={
-        "email": ADMIN_EMAIL,
-        "password": ADMIN_PASSWORD
-    })
-    if response.status_code == 200:
-        return response.json().get("access_token")
+    token = _login_cached(request, api_client, "arbeit/admin_jwt", ADMIN_EMAIL, ADMIN_PASSWORD)
+    if token:
+        return token
     pytest.skip("Admin authentication failed - skipping authenticated tests")
 
 
-@pytest.fixture
-def client_token(api_client):
+@pytest.fixture(scope="session")
+def client_token(request, api_client):
     """Get client user authentication token"""
-    response = api_client.post(f"{BASE_URL}/api/auth/login", json={
-        "email": CLIENT_EMAIL,
-        "password": CLIENT_PASSWORD
-    })
-    if response.status_code == 200:
-        return response.json().get("access_token")
+    token = _login_cached(request, api_client, "arbeit/client_jwt", CLIENT_EMAIL, CLIENT_PASSWORD)
+    if token:
+        return token
     pytest.skip("Client authentication failed - skipping authenticated tests")
 
 
-@pytest.fixture
-def authenticated_admin_client(api_client, admin_token):
+def _auth_session(token):
+    """Build a dedicated requests session carrying one bearer token"""
+    return _session(Authorization=f"Bearer {token}")
+
+
+@pytest.fixture(scope="session")
+def authenticated_admin_client(admin_token):
     """Session with admin auth header"""
-    api_client.headers.update({"Authorization": f"Bearer {admin_token}"})
-    return api_client
+    session = _auth_session(admin_token)
+    yield session
+    session.close()
 
 
-@pytest.fixture
-def authenticated_client_user(api_client, client_token):
+@pytest.fixture(scope="session")
+def authenticated_client_user(client_token):
     """Session with client user auth header"""
-    api_client.headers.update({"Authorization": f"Bearer {client_token}"})
-    return api_client
+    session = _auth_session(client_token)
+    yield session
+    session.close()
+
+
+async def _create_flow_interviews(token):
+    """Create every FLOW_INTERVIEWS interview concurrently over one HTTP/2 connection"""
+    async with httpx.AsyncClient(
+        base_url=BASE_URL,
+        headers={**JSON_HEADERS, "Authorization": f"Bearer {token}"},
+        http2=True,
+        limits=httpx.Limits(max_keepalive_connections=32)
+    ) as client:
+        responses = await asyncio.gather(*(
+            client.post("/api/interviews", content=_body({
+                "job_id": EXISTING_JOB_ID,
+                "candidate_id": EXISTING_CANDIDATE_ID,
+                "interview_mode": mode,
+                "interview_duration": duration,
+                "proposed_slots": [{"start_time": SLOTS[days]["start"], "end_time": SLOTS[days]["end"]}]
+            }))
+            for mode, duration, days in FLOW_INTERVIEWS.values()
+        ))
+    return dict(zip(FLOW_INTERVIEWS, responses))
+
+
+@pytest.fixture(scope="module")
+def created_interviews(admin_token):
+    """Create responses for the FLOW_INTERVIEWS interviews, keyed like FLOW_INTERVIEWS"""
+    return asyncio.run(_create_flow_interviews(admin_token))
+
+
+def _created(create_response):
+    """(interview_id, slot_id) of a create-interview response, parsing the body once"""
+    assert create_response.status_code == 200, f"Create interview failed: {create_response.text}"
+    data = create_response.json()
+    return data["interview_id"], data["proposed_slots"][0]["slot_id"]
+
+
+@pytest.fixture(scope="module")
+def invalid_slot_interview(created_interviews):
+    """(interview_id, slot_id) of the interview used by the invalid slot booking test"""
+    return _created(created_interviews["invalid_slot"])
+
+
+@pytest.fixture(scope="module")
+def booked_interview(authenticated_admin_client, created_interviews):
+    """(interview_id, slot_id, booking response) of one interview booked once per module.
+
+    Shared by TestInterviewInvite and TestInterviewStatusActions, which drive it
+    through invite -> completed -> no-show -> cancelled in file order.
+    """
+    interview_id, slot_id = _created(created_interviews["booked"])
+    response = authenticated_admin_client.post(
+        f"{BASE_URL}/api/interviews/{interview_id}/book-slot",
+        data=_body({"slot_id": slot_id, "confirmed": True}),
+        headers=JSON_HEADERS
+    )
+    assert response.status_code == 200, f"book-slot failed: {response.text}"
+    return interview_id, slot_id, response.json()
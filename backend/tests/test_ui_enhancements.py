@@ -7,75 +7,102 @@ Test suite for UI/UX Enhancement features:
 5. Client user management (edit/delete)
 """
 
+import asyncio
+import httpx
+import itertools
 import pytest
-import requests
+import pytest_asyncio
 import os
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import quote
 
 BASE_URL = os.environ.get('REACT_APP_BACKEND_URL', '').rstrip('/')
 
-# Test credentials
-ADMIN_EMAIL = "connect@arbeit.co.in"
-ADMIN_PASSWORD = "admin123"
+# Route URLs joined once; f-strings remain only where an id is interpolated
+CLIENTS_URL = f"{BASE_URL}/api/clients"
+JOBS_URL = f"{BASE_URL}/api/jobs"
+CANDIDATES_URL = f"{BASE_URL}/api/candidates"
+PIPELINE_STATS_URL = f"{BASE_URL}/api/interviews/stats/pipeline"
 
+# List endpoints behind the dashboard stat cards, relative to BASE_URL
+DASHBOARD_LIST_PATHS = ("/api/clients", "/api/jobs", "/api/interviews")
 
-class TestSetup:
-    """Setup and authentication tests"""
-    
-    @pytest.fixture(scope="class")
-    def admin_token(self):
-        """Get admin authentication token"""
-        response = requests.post(f"{BASE_URL}/api/auth/login", json={
-            "email": ADMIN_EMAIL,
-            "password": ADMIN_PASSWORD
-        })
-        assert response.status_code == 200, f"Admin login failed: {response.text}"
-        return response.json()["access_token"]
-    
-    @pytest.fixture(scope="class")
-    def auth_headers(self, admin_token):
-        """Get authorization headers"""
-        return {"Authorization": f"Bearer {admin_token}"}
+# Suffix unique to this run and xdist worker; uniq() appends a counter per resource
+SUITE_ID = f"{uuid.uuid4().hex[:8]}{os.environ.get('PYTEST_XDIST_WORKER', 'gw0')}"
+_counter = itertools.count()
+
+
+def uniq():
+    """Return a suffix unique across this run's workers and resources"""
+    return f"{SUITE_ID}_{next(_counter):04x}"
+
+
+# Timeout for async_client requests, matching the shared session's (connect, read)
+ASYNC_REQUEST_TIMEOUT = httpx.Timeout(10.0, connect=3.0)
+
+# Concurrent disable calls in the cleanup sweep; stays within http_session's pool_maxsize (20)
+CLEANUP_WORKERS = 16
 
+# GET /api/clients page size used by the cleanup sweep (the endpoint's default limit)
+CLEANUP_PAGE_SIZE = 100
 
-class TestClientExtendedFields(TestSetup):
+# Static parts of the payloads the fixtures create; unique names/emails are added per call
+EXTENDED_CLIENT_TEMPLATE = {
+    "status": "active",
+    "industry": "Technology",
+    "website": "https://example.com",
+    "phone": "+91 98765 43210",
+    "address": "123 Tech Park",
+    "city": "Bangalore",
+    "state": "Karnataka",
+    "country": "India",
+    "postal_code": "560001",
+    "notes": "Test client with extended fields"
+}
+CLIENT_USER_TEMPLATE = {
+    "name": "Test User",
+    "password": "testpass123",
+    "phone": "+91 12345 67890"
+}
+CANDIDATE_TEMPLATE = {
+    "phone": "+91 12345 67890",
+    "skills": ("Python", "Testing")
+}
+
+# http_session, admin_token and auth_headers are session-scoped fixtures in conftest.py.
+# auth_headers authorizes http_session itself, so tests only need it to have run.
+pytestmark = pytest.mark.usefixtures("auth_headers")
+
+
+class TestClientExtendedFields:
     """Test extended client fields (industry, website, phone, address, etc.)"""
     
-    def test_create_client_with_extended_fields(self, auth_headers):
-        """Test creating a client with all extended fields"""
-        client_data = {
-            "company_name": f"TEST_ExtendedClient_{os.urandom(4).hex()}",
-            "status": "active",
-            "industry": "Technology",
-            "website": "https://example.com",
-            "phone": "+91 98765 43210",
-            "address": "123 Tech Park",
-            "city": "Bangalore",
-            "state": "Karnataka",
-            "country": "India",
-            "postal_code": "560001",
-            "notes": "Test client with extended fields"
-        }
+    @pytest.fixture(scope="class")
+    def extended_client(self, http_session, auth_headers):
+        """Create one client with all extended fields; returns (request payload, create response)"""
+        client_data = {**EXTENDED_CLIENT_TEMPLATE, "company_name": f"TEST_ExtendedClient_{uniq()}"}
         
-        response = requests.post(f"{BASE_URL}/api/clients", json=client_data, headers=auth_headers)
+        response = http_session.post(CLIENTS_URL, json=client_data)
         assert response.status_code in [200, 201], f"Create client failed: {response.text}"
-        
         data = response.json()
+        print(f"Created test client: {data['client_id']}")
+        return client_data, data
+    
+    def test_create_client_with_extended_fields(self, extended_client):
+        """Test creating a client with all extended fields"""
+        client_data, data = extended_client
+        
         assert data["company_name"] == client_data["company_name"]
         assert data["industry"] == "Technology"
         assert data["website"] == "https://example.com"
         assert data["phone"] == "+91 98765 43210"
         assert data["city"] == "Bangalore"
         assert data["country"] == "India"
-        
-        # Store client_id for cleanup
-        self.__class__.test_client_id = data["client_id"]
-        print(f"Created test client: {data['client_id']}")
     
-    def test_update_client_extended_fields(self, auth_headers):
+    def test_update_client_extended_fields(self, http_session, extended_client):
         """Test updating client with extended fields"""
-        if not hasattr(self.__class__, 'test_client_id'):
-            pytest.skip("No test client created")
+        _, created = extended_client
         
         update_data = {
             "industry": "Healthcare",
@@ -87,10 +114,9 @@ class TestClientExtendedFields(TestSetup):
             "notes": "Updated notes"
         }
         
-        response = requests.put(
-            f"{BASE_URL}/api/clients/{self.__class__.test_client_id}",
-            json=update_data,
-            headers=auth_headers
+        response = http_session.put(
+            f"{CLIENTS_URL}/{created['client_id']}",
+            json=update_data
         )
         assert response.status_code == 200, f"Update client failed: {response.text}"
         
@@ -100,15 +126,11 @@ class TestClientExtendedFields(TestSetup):
         assert data["city"] == "Mumbai"
         print(f"Updated client extended fields successfully")
     
-    def test_get_client_returns_extended_fields(self, auth_headers):
+    def test_get_client_returns_extended_fields(self, http_session, extended_client):
         """Test that GET client returns all extended fields"""
-        if not hasattr(self.__class__, 'test_client_id'):
-            pytest.skip("No test client created")
+        _, created = extended_client
         
-        response = requests.get(
-            f"{BASE_URL}/api/clients/{self.__class__.test_client_id}",
-            headers=auth_headers
-        )
+        response = http_session.get(f"{CLIENTS_URL}/{created['client_id']}")
         assert response.status_code == 200, f"Get client failed: {response.text}"
         
         data = response.json()
@@ -125,59 +147,50 @@ class TestClientExtendedFields(TestSetup):
         print(f"Client extended fields verified: industry={data.get('industry')}, city={data.get('city')}")
 
 
-class TestClientUserManagement(TestSetup):
-    """Test client user edit and delete functionality"""
+@pytest.fixture(scope="module")
+def shared_client(http_session, auth_headers):
+    """Create one test client per module and return its client_id"""
+    client_data = {
+        "company_name": f"TEST_UserMgmtClient_{uniq()}",
+        "status": "active"
+    }
+    response = http_session.post(CLIENTS_URL, json=client_data)
+    assert response.status_code in [200, 201]
+    return response.json()["client_id"]
+
+
+@pytest.fixture
+def fresh_user(http_session, shared_client):
+    """Create a new user under shared_client for each test, so tests never see each other's edits"""
+    user_data = {**CLIENT_USER_TEMPLATE, "email": f"test_user_{uniq()}@example.com"}
+    response = http_session.post(
+        f"{CLIENTS_URL}/{shared_client}/users",
+        json=user_data
+    )
+    assert response.status_code in [200, 201], f"Create user failed: {response.text}"
     
-    @pytest.fixture(scope="class")
-    def test_client_with_user(self, auth_headers):
-        """Create a test client with a user for testing"""
-        # Create client
-        client_data = {
-            "company_name": f"TEST_UserMgmtClient_{os.urandom(4).hex()}",
-            "status": "active"
-        }
-        response = requests.post(f"{BASE_URL}/api/clients", json=client_data, headers=auth_headers)
-        assert response.status_code in [200, 201]
-        client_id = response.json()["client_id"]
-        
-        # Create user for this client
-        user_data = {
-            "email": f"test_user_{os.urandom(4).hex()}@example.com",
-            "name": "Test User",
-            "password": "testpass123",
-            "phone": "+91 12345 67890"
-        }
-        response = requests.post(
-            f"{BASE_URL}/api/clients/{client_id}/users",
-            json=user_data,
-            headers=auth_headers
-        )
-        assert response.status_code in [200, 201], f"Create user failed: {response.text}"
-        
-        return {
-            "client_id": client_id,
-            "user_email": user_data["email"],
-            "user_name": user_data["name"]
-        }
+    return {
+        "client_id": shared_client,
+        "user_email": user_data["email"],
+        "user_name": user_data["name"],
+        # Percent-encoded once here rather than in every test
+        "user_url": f"{CLIENTS_URL}/{shared_client}/users/{quote(user_data['email'], safe='')}"
+    }
+
+
+class TestClientUserManagement:
+    """Test client user edit and delete functionality"""
     
-    def test_update_client_user(self, auth_headers, test_client_with_user):
+    def test_update_client_user(self, http_session, fresh_user):
         """Test updating a client user's name and phone"""
-        client_id = test_client_with_user["client_id"]
-        user_email = test_client_with_user["user_email"]
+        user_email = fresh_user["user_email"]
         
         update_data = {
             "name": "Updated User Name",
             "phone": "+91 99999 88888"
         }
         
-        # URL encode the email
-        encoded_email = quote(user_email, safe='')
-        
-        response = requests.put(
-            f"{BASE_URL}/api/clients/{client_id}/users/{encoded_email}",
-            json=update_data,
-            headers=auth_headers
-        )
+        response = http_session.put(fresh_user["user_url"], json=update_data)
         assert response.status_code == 200, f"Update user failed: {response.text}"
         
         data = response.json()
@@ -185,167 +198,127 @@ class TestClientUserManagement(TestSetup):
         assert data["phone"] == "+91 99999 88888"
         print(f"Updated client user: {user_email}")
     
-    def test_update_client_user_partial(self, auth_headers, test_client_with_user):
+    def test_update_client_user_partial(self, http_session, fresh_user):
         """Test partial update of client user (only name)"""
-        client_id = test_client_with_user["client_id"]
-        user_email = test_client_with_user["user_email"]
-        
         update_data = {
             "name": "Partially Updated Name"
         }
         
-        encoded_email = quote(user_email, safe='')
-        
-        response = requests.put(
-            f"{BASE_URL}/api/clients/{client_id}/users/{encoded_email}",
-            json=update_data,
-            headers=auth_headers
-        )
+        response = http_session.put(fresh_user["user_url"], json=update_data)
         assert response.status_code == 200, f"Partial update failed: {response.text}"
         
         data = response.json()
         assert data["name"] == "Partially Updated Name"
         print(f"Partial update successful")
     
-    def test_update_nonexistent_user(self, auth_headers, test_client_with_user):
-        """Test updating a non-existent user returns 404"""
-        client_id = test_client_with_user["client_id"]
-        
-        response = requests.put(
-            f"{BASE_URL}/api/clients/{client_id}/users/nonexistent@example.com",
-            json={"name": "Test"},
-            headers=auth_headers
-        )
-        assert response.status_code == 404
-        print("Non-existent user update correctly returns 404")
-    
-    def test_delete_client_user(self, auth_headers, test_client_with_user):
+    def test_delete_client_user(self, http_session, fresh_user):
         """Test deleting a client user"""
-        client_id = test_client_with_user["client_id"]
-        user_email = test_client_with_user["user_email"]
+        client_id = fresh_user["client_id"]
+        user_email = fresh_user["user_email"]
         
-        encoded_email = quote(user_email, safe='')
-        
-        response = requests.delete(
-            f"{BASE_URL}/api/clients/{client_id}/users/{encoded_email}",
-            headers=auth_headers
-        )
+        response = http_session.delete(fresh_user["user_url"])
         assert response.status_code == 200, f"Delete user failed: {response.text}"
         
         # Verify user is deleted
-        response = requests.get(
-            f"{BASE_URL}/api/clients/{client_id}/users",
-            headers=auth_headers
-        )
+        response = http_session.get(f"{CLIENTS_URL}/{client_id}/users")
         users = response.json()
         user_emails = [u["email"] for u in users]
         assert user_email not in user_emails
         print(f"Deleted client user: {user_email}")
     
-    def test_delete_nonexistent_user(self, auth_headers, test_client_with_user):
-        """Test deleting a non-existent user returns 404"""
-        client_id = test_client_with_user["client_id"]
-        
-        response = requests.delete(
-            f"{BASE_URL}/api/clients/{client_id}/users/nonexistent@example.com",
-            headers=auth_headers
+    @pytest.mark.parametrize("method,payload", [
+        ("PUT", {"name": "Test"}),
+        ("DELETE", None),
+    ], ids=["update", "delete"])
+    def test_nonexistent_user(self, http_session, shared_client, method, payload):
+        """Test updating or deleting a non-existent user returns 404"""
+        response = http_session.request(
+            method,
+            f"{CLIENTS_URL}/{shared_client}/users/nonexistent@example.com",
+            json=payload
         )
         assert response.status_code == 404
-        print("Non-existent user delete correctly returns 404")
+        print(f"Non-existent user {method} correctly returns 404")
+
+
+@pytest.fixture(scope="session")
+def any_job_id(http_session, auth_headers):
+    """job_id of an existing job, creating a client and job once if there are none"""
+    response = http_session.get(JOBS_URL, params={"limit": 1})
+    assert response.status_code == 200, f"List jobs failed: {response.text}"
+    jobs = response.json()
+    if jobs:
+        return jobs[0]["job_id"]
+    
+    # Create a client first
+    client_response = http_session.post(
+        CLIENTS_URL,
+        json={"company_name": f"TEST_DeleteCandClient_{uniq()}"}
+    )
+    client_id = client_response.json()["client_id"]
+    
+    # Create a job
+    job_response = http_session.post(
+        JOBS_URL,
+        json={
+            "title": "Test Position",
+            "location": "Remote",
+            "employment_type": "Full-time",
+            "experience_range": {"min_years": 0, "max_years": 5},
+            "work_model": "Remote",
+            "description": "Test job for candidate deletion",
+            "client_id": client_id
+        }
+    )
+    return job_response.json()["job_id"]
 
 
-class TestDeleteCandidate(TestSetup):
+class TestDeleteCandidate:
     """Test candidate deletion functionality"""
     
     @pytest.fixture(scope="class")
-    def test_candidate(self, auth_headers):
+    def test_candidate(self, http_session, auth_headers, any_job_id):
         """Create a test candidate for deletion testing"""
-        # First get or create a job
-        response = requests.get(f"{BASE_URL}/api/jobs", headers=auth_headers)
-        jobs = response.json()
-        
-        if jobs:
-            job_id = jobs[0]["job_id"]
-        else:
-            # Create a client first
-            client_response = requests.post(
-                f"{BASE_URL}/api/clients",
-                json={"company_name": f"TEST_DeleteCandClient_{os.urandom(4).hex()}"},
-                headers=auth_headers
-            )
-            client_id = client_response.json()["client_id"]
-            
-            # Create a job
-            job_response = requests.post(
-                f"{BASE_URL}/api/jobs",
-                json={
-                    "title": "Test Position",
-                    "location": "Remote",
-                    "employment_type": "Full-time",
-                    "experience_range": {"min_years": 0, "max_years": 5},
-                    "work_model": "Remote",
-                    "description": "Test job for candidate deletion",
-                    "client_id": client_id
-                },
-                headers=auth_headers
-            )
-            job_id = job_response.json()["job_id"]
-        
-        # Create a candidate
         candidate_data = {
-            "job_id": job_id,
-            "name": f"TEST_DeleteCandidate_{os.urandom(4).hex()}",
-            "email": f"delete_test_{os.urandom(4).hex()}@example.com",
-            "phone": "+91 12345 67890",
-            "skills": ["Python", "Testing"]
+            **CANDIDATE_TEMPLATE,
+            "job_id": any_job_id,
+            "name": f"TEST_DeleteCandidate_{uniq()}",
+            "email": f"delete_test_{uniq()}@example.com",
+            "skills": list(CANDIDATE_TEMPLATE["skills"])
         }
         
-        response = requests.post(
-            f"{BASE_URL}/api/candidates",
-            json=candidate_data,
-            headers=auth_headers
-        )
+        response = http_session.post(CANDIDATES_URL, json=candidate_data)
         assert response.status_code in [200, 201], f"Create candidate failed: {response.text}"
         
-        return response.json()
+        data = response.json()
+        data["candidate_url"] = f"{CANDIDATES_URL}/{data['candidate_id']}"
+        return data
     
-    def test_delete_candidate_success(self, auth_headers, test_candidate):
+    def test_delete_candidate_success(self, http_session, test_candidate):
         """Test successful candidate deletion"""
         candidate_id = test_candidate["candidate_id"]
         
-        response = requests.delete(
-            f"{BASE_URL}/api/candidates/{candidate_id}",
-            headers=auth_headers
-        )
+        response = http_session.delete(test_candidate["candidate_url"])
         assert response.status_code == 200, f"Delete candidate failed: {response.text}"
         
         # Verify candidate is deleted
-        response = requests.get(
-            f"{BASE_URL}/api/candidates/{candidate_id}",
-            headers=auth_headers
-        )
+        response = http_session.get(test_candidate["candidate_url"])
         assert response.status_code == 404
         print(f"Deleted candidate: {candidate_id}")
     
-    def test_delete_nonexistent_candidate(self, auth_headers):
+    def test_delete_nonexistent_candidate(self, http_session):
         """Test deleting a non-existent candidate returns 404"""
-        response = requests.delete(
-            f"{BASE_URL}/api/candidates/nonexistent_candidate_id",
-            headers=auth_headers
-        )
+        response = http_session.delete(f"{CANDIDATES_URL}/nonexistent_candidate_id")
         assert response.status_code == 404
         print("Non-existent candidate delete correctly returns 404")
 
 
-class TestInterviewPipelineStats(TestSetup):
+class TestInterviewPipelineStats:
     """Test interview pipeline statistics endpoint"""
     
-    def test_get_pipeline_stats(self, auth_headers):
+    def test_get_pipeline_stats(self, http_session):
         """Test getting interview pipeline statistics"""
-        response = requests.get(
-            f"{BASE_URL}/api/interviews/stats/pipeline",
-            headers=auth_headers
-        )
+        response = http_session.get(PIPELINE_STATS_URL)
         assert response.status_code == 200, f"Get pipeline stats failed: {response.text}"
         
         data = response.json()
@@ -366,73 +339,81 @@ class TestInterviewPipelineStats(TestSetup):
         print(f"Pipeline stats: {data}")
 
 
-class TestDashboardNavigation(TestSetup):
+@pytest_asyncio.fixture
+async def async_client(admin_token):
+    """Admin-authorized async client for tests that fan out independent GETs"""
+    async with httpx.AsyncClient(
+        base_url=BASE_URL,
+        headers={"Authorization": f"Bearer {admin_token}"},
+        http2=True,
+        timeout=ASYNC_REQUEST_TIMEOUT,
+        limits=httpx.Limits(max_connections=20, max_keepalive_connections=20)
+    ) as client:
+        yield client
+
+
+class TestDashboardNavigation:
     """Test that dashboard endpoints return proper data for navigation"""
     
-    def test_clients_list_endpoint(self, auth_headers):
-        """Test clients list endpoint works for dashboard navigation"""
-        response = requests.get(f"{BASE_URL}/api/clients", headers=auth_headers)
-        assert response.status_code == 200
-        assert isinstance(response.json(), list)
-        print(f"Clients endpoint returns {len(response.json())} clients")
-    
-    def test_jobs_list_endpoint(self, auth_headers):
-        """Test jobs list endpoint works for dashboard navigation"""
-        response = requests.get(f"{BASE_URL}/api/jobs", headers=auth_headers)
-        assert response.status_code == 200
-        assert isinstance(response.json(), list)
-        print(f"Jobs endpoint returns {len(response.json())} jobs")
+    @pytest.mark.asyncio
+    async def test_dashboard_list_endpoints(self, async_client):
+        """Test the clients, jobs and interviews list endpoints concurrently"""
+        # Only the response shape matters here, so fetch a single row from each
+        responses = await asyncio.gather(*(
+            async_client.get(path, params={"limit": 1}) for path in DASHBOARD_LIST_PATHS
+        ))
+        # Check every endpoint before failing so one run reports all broken paths
+        failures = []
+        for path, response in zip(DASHBOARD_LIST_PATHS, responses):
+            if response.status_code != 200:
+                failures.append(f"{path}: HTTP {response.status_code} {response.text}")
+                continue
+            data = response.json()
+            if not isinstance(data, list):
+                failures.append(f"{path}: expected a list")
+                continue
+            print(f"{path} returns a list ({len(data)} of limit 1)")
+        assert not failures, "Dashboard endpoints failed:\n" + "\n".join(failures)
     
-    def test_candidates_list_endpoint(self, auth_headers):
+    def test_candidates_list_endpoint(self, http_session, any_job_id):
         """Test candidates list endpoint works for dashboard navigation"""
-        # First get a job to list candidates for
-        response = requests.get(f"{BASE_URL}/api/jobs", headers=auth_headers)
+        response = http_session.get(f"{JOBS_URL}/{any_job_id}/candidates")
         assert response.status_code == 200
-        jobs = response.json()
-        
-        if jobs:
-            job_id = jobs[0]["job_id"]
-            response = requests.get(f"{BASE_URL}/api/jobs/{job_id}/candidates", headers=auth_headers)
-            assert response.status_code == 200
-            assert isinstance(response.json(), list)
-            print(f"Candidates endpoint returns {len(response.json())} candidates for job {job_id}")
-        else:
-            print("No jobs found to test candidates endpoint")
-    
-    def test_interviews_list_endpoint(self, auth_headers):
-        """Test interviews list endpoint works for dashboard navigation"""
-        response = requests.get(f"{BASE_URL}/api/interviews", headers=auth_headers)
-        assert response.status_code == 200
-        assert isinstance(response.json(), list)
-        print(f"Interviews endpoint returns {len(response.json())} interviews")
+        data = response.json()
+        assert isinstance(data, list)
+        print(f"Candidates endpoint returns {len(data)} candidates for job {any_job_id}")
 
 
 # Cleanup fixture
 @pytest.fixture(scope="session", autouse=True)
-def cleanup(request):
-    """Cleanup test data after all tests"""
+def cleanup(request, http_session, auth_headers):
+    """Cleanup test data after all tests, reusing the session's admin login"""
     def cleanup_test_data():
-        # Login as admin
-        response = requests.post(f"{BASE_URL}/api/auth/login", json={
-            "email": ADMIN_EMAIL,
-            "password": ADMIN_PASSWORD
-        })
-        if response.status_code != 200:
+        # Page through the server-side search for active TEST_ clients; the
+        # regex is case-insensitive, so the exact prefix is re-checked here.
+        test_clients = []
+        skip = 0
+        while True:
+            response = http_session.get(CLIENTS_URL, params={
+                "search": "^TEST_", "status": "active",
+                "skip": skip, "limit": CLEANUP_PAGE_SIZE
+            })
+            if response.status_code != 200:
+                return
+            page = response.json()
+            test_clients += [c for c in page if c["company_name"].startswith("TEST_")]
+            if len(page) < CLEANUP_PAGE_SIZE:
+                break
+            skip += CLEANUP_PAGE_SIZE
+        if not test_clients:
             return
         
-        token = response.json()["access_token"]
-        headers = {"Authorization": f"Bearer {token}"}
+        def disable(client):
+            http_session.patch(f"{CLIENTS_URL}/{client['client_id']}/disable")
+            print(f"Disabled test client: {client['company_name']}")
         
-        # Get all clients and delete TEST_ prefixed ones
-        response = requests.get(f"{BASE_URL}/api/clients", headers=headers)
-        if response.status_code == 200:
-            for client in response.json():
-                if client["company_name"].startswith("TEST_"):
-                    requests.patch(
-                        f"{BASE_URL}/api/clients/{client['client_id']}/disable",
-                        headers=headers
-                    )
-                    print(f"Disabled test client: {client['company_name']}")
+        with ThreadPoolExecutor(max_workers=CLEANUP_WORKERS) as executor:
+            list(executor.map(disable, test_clients))
     
     request.addfinalizer(cleanup_test_data)
 
@@ -10,6 +10,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent / 'backend'))
 
 from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import UpdateOne
 import os
 from dotenv import load_dotenv
 import bcrypt
@@ -21,71 +22,93 @@ load_dotenv(ROOT_DIR / '.env')
 mongo_url = os.environ['MONGO_URL']
 db_name = os.environ['DB_NAME']
 
-def hash_password(password: str) -> str:
-    """Hash a password using bcrypt"""
-    salt = bcrypt.gensalt()
+# bcrypt cost for seeded test accounts only. checkpw accepts any cost, so these
+# hashes log in normally; never use this for real users (the server uses the default 12)
+SEED_BCRYPT_ROUNDS = 4
+
+def hash_password(password: str, rounds: int = SEED_BCRYPT_ROUNDS) -> str:
+    """Hash a password using bcrypt at the (dev-only) seed cost"""
+    salt = bcrypt.gensalt(rounds)
     hashed = bcrypt.hashpw(password.encode('utf-8'), salt)
     return hashed.decode('utf-8')
 
-async def seed_users():
-    """Seed test users"""
-    client = AsyncIOMotorClient(mongo_url)
-    db = client[db_name]
-    
-    # First, create a test client
-    test_client = {
+# Seed records; users carry a plaintext password that is hashed before insert
+TEST_CLIENTS = [
+    {
         "client_id": "client_001",
         "company_name": "Acme Corporation",
         "status": "active",
         "created_at": "2025-01-01T00:00:00"
     }
-    
-    # Check if client exists
-    existing_client = await db.clients.find_one({"client_id": "client_001"})
-    if not existing_client:
-        await db.clients.insert_one(test_client)
-        print("✓ Created test client: Acme Corporation (client_001)")
-    else:
-        print("✓ Test client already exists")
-    
-    # Define test users
-    test_users = [
-        {
-            "email": "admin@arbeit.com",
-            "password": "admin123",
-            "name": "Admin User",
-            "role": "admin",
-            "client_id": None
-        },
-        {
-            "email": "recruiter@arbeit.com",
-            "password": "recruiter123",
-            "name": "Sarah Recruiter",
-            "role": "recruiter",
-            "client_id": None
-        },
-        {
-            "email": "client@acme.com",
-            "password": "client123",
-            "name": "John Client",
-            "role": "client_user",
-            "client_id": "client_001"
-        }
-    ]
-    
-    for user_data in test_users:
-        # Check if user exists
-        existing_user = await db.users.find_one({"email": user_data["email"]})
+]
+
+TEST_USERS = [
+    {
+        "email": "admin@arbeit.com",
+        "password": "admin123",
+        "name": "Admin User",
+        "role": "admin",
+        "client_id": None
+    },
+    {
+        "email": "recruiter@arbeit.com",
+        "password": "recruiter123",
+        "name": "Sarah Recruiter",
+        "role": "recruiter",
+        "client_id": None
+    },
+    {
+        "email": "client@acme.com",
+        "password": "client123",
+        "name": "John Client",
+        "role": "client_user",
+        "client_id": "client_001"
+    }
+]
+
+def prepare_user(user: dict) -> dict:
+    """Return the stored form of a seed user: password swapped for its hash"""
+    prepared = {k: v for k, v in user.items() if k != "password"}
+    prepared["password_hash"] = hash_password(user["password"])
+    prepared["created_at"] = "2025-01-01T00:00:00"
+    return prepared
+
+async def upsert_missing(collection, key: str, docs: list) -> set:
+    """Insert docs whose key is not already present, in one unordered bulk write.
+
+    Returns the indexes of the docs that were inserted.
+    """
+    result = await collection.bulk_write([
+        UpdateOne({key: doc[key]}, {"$setOnInsert": doc}, upsert=True)
+        for doc in docs
+    ], ordered=False)
+    return set(result.upserted_ids)
+
+async def seed_users():
+    """Seed test users"""
+    client = AsyncIOMotorClient(mongo_url)
+    try:
+        db = client[db_name]
+        prepared = [prepare_user(user) for user in TEST_USERS]
         
-        if existing_user:
-            print(f"✓ User {user_data['email']} already exists")
-        else:
-            password = user_data.pop("password")
-            user_data["password_hash"] = hash_password(password)
-            user_data["created_at"] = "2025-01-01T00:00:00"
-            
-            await db.users.insert_one(user_data)
-            print(f"✓ Created user: {user_data['email']} (role: {user_data['role']})")
+        # Clients and users are independent collections, so write both at once
+        created_clients, created_users = await asyncio.gather(
+            upsert_missing(db.clients, "client_id", TEST_CLIENTS),
+            upsert_missing(db.users, "email", prepared)
+        )
+        
+        for index, test_client in enumerate(TEST_CLIENTS):
+            if index in created_clients:
+                print(f"✓ Created test client: {test_client['company_name']} ({test_client['client_id']})")
+            else:
+                print("✓ Test client already exists")
+        for index, user_data in enumerate(prepared):
+            if index in created_users:
+                print(f"✓ Created user: {user_data['email']} (role: {user_data['role']})")
+            else:
+                print(f"✓ User {user_data['email']} already exists")
+    finally:
+        client.close()
     
     print("\n" + "="*60)
     print("PHASE 1 TEST CREDENTIALS")
@@ -100,8 +123,6 @@ async def seed_users():
     print("  Email: client@acme.com")
     print("  Password: client123")
     print("="*60)
-    
-    client.close()
 
 if __name__ == "__main__":
     asyncio.run(seed_users())